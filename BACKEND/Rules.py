@@ -1,6 +1,34 @@
-from .Tokenizer import tokenize
+import operator
+
+from .Tokenizer import tokenize, parse_condition
 from .AST import Node
 
+COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+# Rule operators that are spelled differently in SQL (NULL-safe equality)
+SQL_OPERATORS = {'==': 'IS', '!=': 'IS NOT'}
+
+# numpy dtype kind -> (kind used for rule type checks, SQLite column type)
+COLUMN_KINDS = {
+    'b': ("numeric", "INTEGER"),
+    'i': ("numeric", "INTEGER"),
+    'u': ("numeric", "INTEGER"),
+    'f': ("numeric", "REAL"),
+    'O': ("text", "TEXT"),
+    'S': ("text", "TEXT"),
+    'U': ("text", "TEXT"),
+}
+
+# Python types accepted in a schema, mapped to their dtype kind
+PYTHON_KINDS = {bool: 'b', int: 'i', float: 'f', str: 'U'}
+
 def create_rule(rule_string):
     """
     Create an abstract syntax tree (AST) from a given rule string.
@@ -101,3 +129,132 @@ def evaluate_rule(node, data):
         elif node.value == "OR":
             # Return True if either left or right subtree is True
             return evaluate_rule(node.left, data) or evaluate_rule(node.right, data)
+
+
+def column_kind(column_type):
+    """
+    Return the numpy-style kind character of a Python type or a numpy/pandas dtype.
+
+    :param column_type: A Python type (bool, int, float, str) or a dtype
+    :return: One of the keys of COLUMN_KINDS
+    :raises ValueError: If the type cannot be classified
+    """
+    kind = PYTHON_KINDS.get(column_type, getattr(column_type, "kind", None))
+    if kind not in COLUMN_KINDS:
+        raise ValueError(f"Unsupported column type: {column_type!r}")
+    return kind
+
+
+def _value_kind(value_type):
+    """Classify a Python type or a numpy/pandas dtype as "numeric" or "text"."""
+    return COLUMN_KINDS[column_kind(value_type)][0]
+
+
+def _compare_or_false(compare):
+    """Wrap a comparison so that missing or incomparable values (None, NaN, pd.NA) evaluate to False."""
+    def safe_compare(left, right):
+        try:
+            return bool(compare(left, right))
+        except TypeError:
+            return False
+    return safe_compare
+
+
+def bind_rule(node, schema, index=False):
+    """
+    Bind an AST to a schema and return an evaluator over tuple rows.
+
+    Every condition is checked once against the schema: referenced fields
+    must be columns and literals must match the column type. The returned
+    evaluator reads fields by position, so it can be called directly on
+    plain tuples or on rows from ``DataFrame.itertuples()``. Like
+    ``evaluate_rule``, a comparison against a missing value (None, NaN or pd.NA)
+    that cannot be decided evaluates to False for that row.
+
+    :param node: The root of the AST to bind
+    :param schema: A mapping of column name to type (in row order), or a
+        DataFrame whose dtypes are used
+    :param index: Set to True when rows carry a leading index value, as
+        ``DataFrame.itertuples()`` does by default
+    :return: A function taking a row tuple and returning a bool
+    :raises ValueError: If a field is unknown, a column type is unsupported
+        or a literal has the wrong type
+    """
+    if hasattr(schema, "dtypes"):
+        schema = schema.dtypes
+    columns = list(schema.items())
+    offset = 1 if index else 0
+    positions = {name: i + offset for i, (name, _) in enumerate(columns)}
+    types = dict(columns)
+
+    def lookup(field, condition):
+        if field not in positions:
+            raise ValueError(f"Unknown field '{field}' in condition: {condition}")
+        # Only columns the rule references need a supported type
+        return positions[field], _value_kind(types[field])
+
+    def bind(node):
+        if node.operation == "operand":
+            field, op, value, value_is_field = parse_condition(node.value)
+            position, kind = lookup(field, node.value)
+            compare = _compare_or_false(COMPARISONS[op])
+
+            if value_is_field:
+                other, other_kind = lookup(value, node.value)
+                if kind != other_kind:
+                    raise ValueError(f"Cannot compare {kind} field '{field}' with {other_kind} "
+                                     f"field '{value}' in condition: {node.value}")
+                return lambda row: compare(row[position], row[other])
+
+            value_kind = _value_kind(type(value))
+            if kind != value_kind:
+                raise ValueError(f"Cannot compare {kind} field '{field}' with {value_kind} "
+                                 f"value {value!r} in condition: {node.value}")
+            return lambda row: compare(row[position], value)
+
+        elif node.operation == "operator":
+            left = bind(node.left)
+            right = bind(node.right)
+            if node.value == "AND":
+                return lambda row: left(row) and right(row)
+            elif node.value == "OR":
+                return lambda row: left(row) or right(row)
+            raise ValueError(f"Unknown operator: {node.value}")
+
+        raise ValueError(f"Unknown node type: {node.operation}")
+
+    return bind(node)
+
+
+def rule_to_sql(node):
+    """
+    Translate an AST into a parameterized SQL WHERE expression.
+
+    Field names are emitted as quoted identifiers and literals are passed as
+    ``?`` parameters, so the result can be used directly with sqlite3.
+    Equality uses ``IS`` / ``IS NOT`` so that NULL (missing) values behave as
+    in ``bind_rule``: ``age != 3`` matches a row where age is missing.
+
+    :param node: The root of the AST to translate
+    :return: A tuple of (where_clause, params)
+    :rtype: tuple[str, list]
+    :raises ValueError: If a condition is malformed
+
+    >>> rule_to_sql(create_rule("age > 30 AND department = 'Sales'"))
+    ('("age" > ? AND "department" IS ?)', [30, 'Sales'])
+    """
+    if node.operation == "operand":
+        field, op, value, value_is_field = parse_condition(node.value)
+        op = SQL_OPERATORS.get(op, op)
+        if value_is_field:
+            return f'"{field}" {op} "{value}"', []
+        return f'"{field}" {op} ?', [value]
+
+    elif node.operation == "operator":
+        if node.value not in ("AND", "OR"):
+            raise ValueError(f"Unknown operator: {node.value}")
+        left, left_params = rule_to_sql(node.left)
+        right, right_params = rule_to_sql(node.right)
+        return f"({left} {node.value} {right})", left_params + right_params
+
+    raise ValueError(f"Unknown node type: {node.operation}")
@@ -1,5 +1,12 @@
 import re
 
+# Building blocks of a condition such as "age > 30", shared by the validator,
+# the tokenizer, the condition parser and the SQL translator.
+IDENTIFIER_PATTERN = r"[a-zA-Z_][a-zA-Z0-9_]*"
+OPERATOR_PATTERN = r"==|!=|>=|<=|>|<"
+VALUE_PATTERN = r"[a-zA-Z0-9'_]+"
+CONDITION_PATTERN = rf"^({IDENTIFIER_PATTERN})\s*({OPERATOR_PATTERN})\s*({VALUE_PATTERN})$"
+
 def is_valid_rule(rule_string):
     # 1. Check for balanced parentheses
     """
@@ -43,12 +50,8 @@ def is_parentheses_balanced(rule_string):
 
 def is_valid_condition(condition):
     """Check if the condition is valid (e.g., age > 30, department == 'Sales')."""
-    # Define a regex pattern for valid conditions
-    # Updated pattern to include underscores in variable names
-    pattern = r"^[a-zA-Z_][a-zA-Z0-9_]*\s*(==|!=|>|<|>=|<=)\s*[a-zA-Z0-9'_]+$"
-
-    # Check if the condition matches the pattern
-    return bool(re.match(pattern, condition))
+    # Check if the condition matches the shared condition pattern
+    return bool(re.match(CONDITION_PATTERN, condition))
 
 
 def replace_equals(input_string):
@@ -72,9 +75,46 @@ def tokenize(rule_string):
     rule_string = replace_equals(rule_string)
 
     # Use a regex pattern to split the rule string into tokens (conditions, logical operators, and parentheses)
-    tokens = re.findall(r"\(|\)|AND|OR|[a-zA-Z_][a-zA-Z0-9_]*\s*(?:==|!=|>|<|>=|<=)\s*[a-zA-Z0-9'_]+", rule_string)
+    tokens = re.findall(rf"\(|\)|AND|OR|{IDENTIFIER_PATTERN}\s*(?:{OPERATOR_PATTERN})\s*{VALUE_PATTERN}", rule_string)
 
     # Remove any extraneous whitespace from tokens
     tokens = [token.strip() for token in tokens if token.strip()]
 
     return tokens
+
+
+def parse_condition(condition):
+    """
+    Split a single condition into its field, operator and right-hand side.
+
+    The right-hand side is converted to a Python value: quoted tokens become
+    strings, digits become integers and ``True``/``False`` become booleans.
+    Any other identifier is treated as a reference to another field, just as
+    ``eval`` would look it up in the record.
+
+    :param condition: A condition token such as "age > 30"
+    :return: A tuple of (field, operator, value, value_is_field)
+    :raises ValueError: If the condition or its right-hand side is malformed
+
+    >>> parse_condition("department == 'Sales'")
+    ('department', '==', 'Sales', False)
+    """
+    match = re.match(CONDITION_PATTERN, condition.strip())
+    if not match:
+        raise ValueError(f"Invalid condition: {condition}")
+    field, operator, value = match.groups()
+
+    if re.match(r"^'[^']*'$", value):
+        return field, operator, value[1:-1], False
+    if value.isdigit():
+        return field, operator, int(value), False
+    if value in ('True', 'False'):
+        return field, operator, value == 'True', False
+    if is_identifier(value):
+        return field, operator, value, True
+    raise ValueError(f"Invalid value in condition: {condition}")
+
+
+def is_identifier(name):
+    """Check if name is a valid field (or table) name, e.g. prior_years_experience."""
+    return bool(re.match(rf"^{IDENTIFIER_PATTERN}$", name))
@@ -1,5 +1,10 @@
 import sqlite3
 
+import pandas as pd
+
+from .Rules import rule_to_sql, bind_rule, column_kind, COLUMN_KINDS
+from .Tokenizer import is_identifier
+
 def initialize_database():
     """Create the rules table if it doesn't exist.
 
@@ -130,4 +135,145 @@ def clear_rules():
     except sqlite3.OperationalError:
         pass
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+
+def _column_affinity(column_type):
+    """Map a Python type or a numpy/pandas dtype to an SQLite column type."""
+    return COLUMN_KINDS[column_kind(column_type)][1]
+
+
+def _python_type(declared_type):
+    """
+    Map a declared SQLite column type to a Python type using SQLite's affinity rules.
+
+    Types with NUMERIC or BLOB affinity are returned unchanged, so ``bind_rule``
+    rejects them only if a rule actually references that column.
+    """
+    upper = declared_type.upper()
+    if "INT" in upper:
+        return int
+    if any(text in upper for text in ("CHAR", "CLOB", "TEXT")):
+        return str
+    if any(real in upper for real in ("REAL", "FLOA", "DOUB")):
+        return float
+    return declared_type
+
+
+def _sql_value(value):
+    """Convert a dataset value to one sqlite3 can bind, mapping missing values (NaN, pd.NA, NaT) to NULL."""
+    if value is not None and pd.isna(value):
+        return None
+    return getattr(value, "item", lambda: value)()
+
+
+def _check_identifier(name):
+    """Raise a ValueError if name cannot be used as a table or column name."""
+    if not is_identifier(name):
+        raise ValueError(f"Invalid identifier: {name}")
+
+
+def load_dataset(data, table="dataset", schema=None, indexes=None):
+    """
+    Load a dataset into an indexed SQLite table.
+
+    Any existing table with the same name is replaced; if loading fails the
+    old table is kept. Each row gets an ``id`` equal to its position in the
+    dataset, which is what ``query_rule`` returns for matching rows, so the
+    dataset itself may not have an ``id`` column.
+
+    :param data: A DataFrame, or an iterable of row tuples when schema is given
+    :param str table: The name of the table to create.
+    :param schema: A mapping of column name to type (in row order). Taken
+        from the DataFrame's dtypes when omitted.
+    :param indexes: The columns to index. Defaults to every column.
+    :return: None
+    :rtype: None
+    :raises ValueError: If a table, column or index name is invalid, or a
+        column type is unsupported
+    """
+    if schema is None:
+        schema = data.dtypes
+        data = data.itertuples(index=False, name=None)
+    columns = list(schema.items())
+    _check_identifier(table)
+    for name, _ in columns:
+        _check_identifier(name)
+        if name == "id":
+            raise ValueError("Column name 'id' is reserved for the row id added by load_dataset.")
+    if indexes is None:
+        indexes = [name for name, _ in columns]
+    for name in indexes:
+        if name not in schema:
+            raise ValueError(f"Cannot index unknown column: {name}")
+
+    definitions = ", ".join(f'"{name}" {_column_affinity(column_type)}' for name, column_type in columns)
+    placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+    rows = ((i,) + tuple(_sql_value(value) for value in row)
+            for i, row in enumerate(data))
+
+    conn = sqlite3.connect('rule_engine.db')
+    c = conn.cursor()
+    try:
+        # Run everything in one transaction so a failure leaves the old table in place
+        c.execute("BEGIN")
+        c.execute(f'DROP TABLE IF EXISTS "{table}"')
+        c.execute(f'CREATE TABLE "{table}" (id INTEGER PRIMARY KEY, {definitions})')
+        c.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})', rows)
+        for name in indexes:
+            # Index names are global to the database; the length prefix keeps
+            # e.g. table "a", column "b_c" apart from table "a_b", column "c"
+            c.execute(f'CREATE INDEX "idx_{len(table)}_{table}_{name}" ON "{table}" ("{name}")')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def query_rule(node, table="dataset", count=False):
+    """
+    Evaluate a rule AST inside SQLite against a table created by load_dataset.
+
+    The rule is first checked with ``bind_rule`` against the table's columns,
+    so unknown fields and mismatched literal types raise instead of being
+    resolved by SQLite. It is then translated into a parameterized WHERE
+    clause, so SQLite can use the column indexes instead of evaluating every
+    row in Python.
+
+    Missing values are stored as NULL and compared with ``IS`` / ``IS NOT``,
+    so, as in ``bind_rule``, ``age != 3`` matches a row where age is missing
+    while ordering comparisons such as ``age > 3`` do not.
+
+    :param node: The root of the AST to evaluate, e.g. from create_rule or combine_rules.
+    :param str table: The table to query.
+    :param bool count: Return the number of matching rows instead of their ids.
+    :return: The ids of the matching rows, or their count.
+    :rtype: list[int] or int
+    :raises ValueError: If there is no rule, the table does not exist, a
+        column type is unsupported, a field is unknown or a literal has the
+        wrong type
+    """
+    if node is None:
+        raise ValueError("No rule to query.")
+    _check_identifier(table)
+
+    conn = sqlite3.connect('rule_engine.db')
+    c = conn.cursor()
+    try:
+        c.execute(f'PRAGMA table_info("{table}")')
+        schema = {name: _python_type(column_type) for _, name, column_type, *_ in c.fetchall() if name != "id"}
+        if not schema:
+            raise ValueError(f"Unknown table: {table}")
+        bind_rule(node, schema)
+
+        where, params = rule_to_sql(node)
+        if count:
+            query = f'SELECT COUNT(*) FROM "{table}" WHERE {where}'
+        else:
+            query = f'SELECT id FROM "{table}" WHERE {where} ORDER BY id'
+        c.execute(query, params)
+        rows = c.fetchall()
+    finally:
+        conn.close()
+    if count:
+        return rows[0][0]
+    return [row[0] for row in rows]
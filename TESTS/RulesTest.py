@@ -1,13 +1,20 @@
+import sqlite3
 import unittest
-from BACKEND.Rules import create_rule, evaluate_rule, combine_rules
+
+import pandas as pd
+
+from BACKEND.Rules import create_rule, evaluate_rule, combine_rules, bind_rule, rule_to_sql
 from BACKEND.AST import Node
-from BACKEND.db import initialize_database, save_rule, load_rules,load_rule,delete_rule,update_rule,clear_rules
+from BACKEND.db import initialize_database, save_rule, load_rules,load_rule,delete_rule,update_rule,clear_rules,load_dataset,query_rule
 from BACKEND.Tokenizer import is_valid_rule
 
 rule_string1 = "((age > 30 AND department = 'Sales') OR (age < 25 AND department = 'Marketing')) AND (salary > 50000 OR experience >5)"
 rule_string2 = "((age > 30 AND department = 'Marketing')) AND (salary > 20000 OR experience > 5)"
 invalid_rule_string = "((age > 30 AND department => 'Marketing') AND (salary > 20000 OR experience > 5)"
 valid_rule_string="(department = 'AI' AND age > 40 AND salary > 50000 AND prior_years_experience < 5)"
+schema = {"department": str, "age": int, "salary": float, "prior_years_experience": int}
+rows = [("AI", 45, 60000.0, 3), ("Sales", 45, 60000.0, 3), ("AI", 35, 70000.0, 2), ("AI", 50, 55000.0, 1),
+        (None, None, None, None)]
 
 initialize_database()
 
@@ -45,6 +52,136 @@ class AST_TEST(unittest.TestCase):
         ast_root = create_rule(rule_string2)
         self.assertFalse(evaluate_rule(ast_root, {"age": 35,"department": "Sales", "salary": 60000, "experience": 3}))
 
+    def test_bind_rule(self):
+        """
+        Test that the bind_rule function evaluates tuple rows by column position.
+        """
+        evaluator = bind_rule(create_rule(valid_rule_string), schema)
+        self.assertTrue(evaluator(("AI", 45, 60000.0, 3)))
+        self.assertFalse(evaluator(("Sales", 45, 60000.0, 3)))
+        evaluator = bind_rule(create_rule(valid_rule_string), schema, index=True)
+        self.assertTrue(evaluator((0, "AI", 45, 60000.0, 3)))
+
+    def test_bind_rule_invalid(self):
+        """
+        Test that the bind_rule function rejects unknown fields and mismatched literal types.
+        """
+        with self.assertRaises(ValueError):
+            bind_rule(create_rule(rule_string1), schema)
+        with self.assertRaises(ValueError):
+            bind_rule(create_rule("age > 'forty'"), schema)
+        with self.assertRaises(ValueError):
+            bind_rule(create_rule("age == 'x'"), {"age": "int"})
+
+    def test_bind_rule_missing_value(self):
+        """
+        Test that the bind_rule evaluator treats missing values like evaluate_rule instead of raising.
+        """
+        evaluator = bind_rule(create_rule("age > 3 OR department = 'AI'"), {"department": str, "age": int})
+        self.assertFalse(evaluator(("x", None)))
+        self.assertTrue(evaluator(("AI", None)))
+        self.assertEqual(evaluator(("x", None)), evaluate_rule(create_rule("age > 3"), {"age": None}))
+
+    def test_bind_rule_nullable_dtypes(self):
+        """
+        Test that the bind_rule evaluator treats pd.NA in nullable columns as False.
+        """
+        data = pd.DataFrame({"a": pd.array([1, None], dtype="Int64"), "s": pd.array(["x", None], dtype="string")})
+        evaluator = bind_rule(create_rule("a > 0 AND s == 'x'"), data)
+        self.assertEqual([evaluator(row) for row in data.itertuples(index=False)], [True, False])
+        evaluator = bind_rule(create_rule("a > 0 OR s == 'x'"), data)
+        self.assertEqual([evaluator(row) for row in data.itertuples(index=False)], [True, False])
+
+    def test_bind_rule_unused_column(self):
+        """
+        Test that the bind_rule function only checks the types of columns the rule references.
+        """
+        data = pd.DataFrame({"a": [1, 0], "t": pd.to_datetime(["2020-01-01", "2021-01-01"])})
+        evaluator = bind_rule(create_rule("a > 0"), data, index=True)
+        self.assertEqual([evaluator(row) for row in data.itertuples()], [True, False])
+        with self.assertRaises(ValueError):
+            bind_rule(create_rule("t > 0"), data)
+
+    def test_rule_to_sql(self):
+        """
+        Test that the rule_to_sql function builds a parameterized WHERE clause.
+        """
+        where, params = rule_to_sql(create_rule("(age > 30 AND department = 'Sales') OR salary >= prior_years_experience"))
+        self.assertEqual(where, '(("age" > ? AND "department" IS ?) OR "salary" >= "prior_years_experience")')
+        self.assertEqual(params, [30, 'Sales'])
+
+    def test_db_query_rule(self):
+        """
+        Test that the query_rule function matches the same rows as bind_rule.
+        """
+        load_dataset(rows, table="employees", schema=schema)
+        ast_root = combine_rules([create_rule(valid_rule_string), create_rule("age < 50 OR salary < 60000")])
+        evaluator = bind_rule(ast_root, schema)
+        expected = [i for i, row in enumerate(rows) if evaluator(row)]
+        self.assertEqual(query_rule(ast_root, table="employees"), expected)
+        self.assertEqual(query_rule(ast_root, table="employees", count=True), len(expected))
+        ast_root = create_rule("age != 45 OR department = 'Sales'")
+        evaluator = bind_rule(ast_root, schema)
+        expected = [i for i, row in enumerate(rows) if evaluator(row)]
+        self.assertIn(len(rows) - 1, expected)
+        self.assertEqual(query_rule(ast_root, table="employees"), expected)
+
+    def test_db_query_rule_invalid(self):
+        """
+        Test that the query_rule function rejects unknown fields and mismatched literal types.
+        """
+        load_dataset(rows, table="employees", schema=schema)
+        with self.assertRaises(ValueError):
+            query_rule(create_rule("experience > 5"), table="employees")
+        with self.assertRaises(ValueError):
+            query_rule(create_rule("department > 5"), table="employees")
+        with self.assertRaises(ValueError):
+            query_rule(combine_rules([]), table="employees")
+
+    def test_db_query_rule_declared_types(self):
+        """
+        Test that the query_rule function maps declared column types by SQLite affinity.
+        """
+        conn = sqlite3.connect('rule_engine.db')
+        conn.execute('DROP TABLE IF EXISTS "declared"')
+        conn.execute('CREATE TABLE "declared" (id INTEGER PRIMARY KEY, name VARCHAR(10), score DOUBLE, blob BLOB)')
+        conn.execute('INSERT INTO "declared" VALUES (0, \'AI\', 1.5, NULL)')
+        conn.commit()
+        conn.close()
+        self.assertEqual(query_rule(create_rule("name = 'AI' AND score > 1"), table="declared"), [0])
+        with self.assertRaises(ValueError):
+            query_rule(create_rule("blob = 'x'"), table="declared")
+
+    def test_db_load_dataset_invalid(self):
+        """
+        Test that the load_dataset function validates columns up front and keeps the old table on failure.
+        """
+        load_dataset(rows, table="employees", schema=schema)
+        with self.assertRaises(ValueError):
+            load_dataset(rows, table="employees", schema=schema, indexes=["experience"])
+        with self.assertRaises(ValueError):
+            load_dataset([(1, "AI")], table="employees", schema={"id": int, "department": str})
+        with self.assertRaises(sqlite3.Error):
+            load_dataset([("AI",)], table="employees", schema=schema)
+        self.assertEqual(query_rule(create_rule("age > 0"), table="employees", count=True), len(rows) - 1)
+
+    def test_db_load_dataset_index_names(self):
+        """
+        Test that the load_dataset function gives each table's indexes distinct names.
+        """
+        load_dataset([(1,)], table="a", schema={"b_c": int})
+        load_dataset([(1,)], table="a_b", schema={"c": int})
+        self.assertEqual(query_rule(create_rule("c > 0"), table="a_b"), [0])
+
+    def test_db_load_dataset_nullable_dtypes(self):
+        """
+        Test that the load_dataset function stores pd.NA from nullable columns as NULL.
+        """
+        data = pd.DataFrame({"a": pd.array([1, None], dtype="Int64"), "s": pd.array(["x", None], dtype="string")})
+        load_dataset(data, table="nullable")
+        self.assertEqual(query_rule(create_rule("a > 0 AND s == 'x'"), table="nullable"), [0])
+        self.assertEqual(query_rule(create_rule("a != 1"), table="nullable"), [1])
+
     def test_db_save_rule_and_load_rules(self):
         """
         Test that the save_rule and load_rules functions work correctly.